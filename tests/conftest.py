@@ -1,4 +1,93 @@
+import copy
+
 import pytest
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
+
+def make_issue(key, summary, itype="Story", sprints=(), parent=None):
+    """Build a lightweight stand-in for a Jira issue.
+
+    The production code only reads a fixed set of fields, so concrete
+    SimpleNamespace objects are both faster than Mock (plain attribute
+    lookup, no on-demand child creation) and stricter (any other field
+    access raises AttributeError).
+    """
+    fields = SimpleNamespace(
+        summary=summary,
+        issuetype=SimpleNamespace(name=itype),
+        customfield_10020=list(sprints))
+    if parent is not None:
+        fields.parent = SimpleNamespace(key=parent)
+    return SimpleNamespace(key=key, fields=fields)
+
+
+def _make_sprint(name, goal):
+    return SimpleNamespace(name=name, goal=goal)
+
+
+@pytest.fixture(scope="session")
+def _mock_issue_proto():
+    return make_issue(
+        "FR-123", "Test issue",
+        sprints=[_make_sprint("Sprint 1", "Ship the release")])
+
+
+@pytest.fixture(scope="session")
+def _mock_issue_with_epic_proto():
+    return make_issue(
+        "FR-124", "Task in an epic", itype="Task",
+        sprints=[_make_sprint("Sprint 1", "Ship the release")],
+        parent="FR-100")
+
+
+@pytest.fixture(scope="session")
+def _mock_epic_proto():
+    return SimpleNamespace(
+        key="FR-100",
+        fields=SimpleNamespace(summary="Epic A", status="Done"))
+
+
+@pytest.fixture
+def mock_epic(_mock_epic_proto):
+    return copy.copy(_mock_epic_proto)
+
+
+@pytest.fixture(scope="session")
+def _mock_bug_issue_proto():
+    return make_issue(
+        "FR-125", "Fix the installer crash LP#2012345", itype="Bug",
+        sprints=[_make_sprint("Sprint 1", "Ship the release")])
+
+
+@pytest.fixture(scope="session")
+def _mock_jira_api_proto():
+    return Mock()
+
+
+@pytest.fixture
+def mock_jira_api(_mock_jira_api_proto):
+    # Callers assign their own search_issues/issue mocks, so sharing the
+    # prototype's children across copies is safe.
+    return copy.copy(_mock_jira_api_proto)
+
+
+@pytest.fixture(scope="session")
+def _search_effects(_mock_issue_proto, _mock_issue_with_epic_proto,
+                    _mock_bug_issue_proto):
+    # search_issues result batches, built once per session.  The trailing
+    # empty batch terminates find_issue_in_jira_sprint's pagination loop.
+    return {
+        "basic": ([_mock_issue_proto], []),
+        "epic": ([_mock_issue_with_epic_proto], []),
+        "bug": ([_mock_bug_issue_proto], []),
+        "empty": ([],),
+    }
+
+
+@pytest.fixture
+def search_effects(_search_effects):
+    # The fake search closure consumes its batches, so hand each test
+    # fresh lists.
+    return {name: list(batches) for name, batches in _search_effects.items()}
@@ -0,0 +1,209 @@
+import re
+
+import pytest
+
+from unittest.mock import Mock
+
+from SprintReport import sprint_report as sr_module
+from SprintReport.sprint_report import (
+    find_issue_in_jira_sprint,
+    get_bug_id,
+    insert_bug_link,
+    key_to_md,
+    main,
+    print_jira_issue,
+    print_jira_report,
+)
+
+
+def assert_ordered_substrings(text, subs):
+    # Advancing the find() offset checks all substrings in one linear
+    # scan, where separate "in" checks rescan from the start each time.
+    idx = 0
+    for s in subs:
+        nxt = text.find(s, idx)
+        assert nxt >= 0, "missing {!r} after offset {}".format(s, idx)
+        idx = nxt + len(s)
+
+
+def _fake_search(batches):
+    # A plain closure is cheaper to call than Mock(side_effect=...), which
+    # records every call we never inspect.
+    it = iter(batches)
+    return lambda *args, **kwargs: next(it)
+
+
+def test_get_bug_id():
+    assert get_bug_id("Fix the installer crash LP#2012345") == "2012345"
+
+
+def test_get_bug_id_without_bug():
+    assert get_bug_id("Fix the installer crash") == ""
+
+
+def test_get_bug_id_with_trailing_text():
+    assert get_bug_id("LP#2012345 breaks the boot") == "2012345"
+
+
+def test_key_to_md():
+    sr_module.jira_server = "https://jira.example.com"
+
+    assert key_to_md("FR-123") == \
+        "[FR-123](https://jira.example.com/browse/FR-123)"
+
+
+def test_insert_bug_link():
+    text = insert_bug_link("Fix the installer crash LP#2012345")
+
+    assert text == \
+        "Fix the installer crash [LP#2012345](https://pad.lv/2012345)"
+
+
+def test_find_issue_in_jira_sprint_requires_api_and_project(mock_jira_api):
+    assert find_issue_in_jira_sprint(None, "FR", "Sprint 1") == {}
+    assert find_issue_in_jira_sprint(mock_jira_api, "", "Sprint 1") == {}
+
+
+def test_find_issue_in_jira_sprint(mock_jira_api, search_effects):
+    mock_jira_api.search_issues = _fake_search(search_effects["basic"])
+
+    issues = find_issue_in_jira_sprint(mock_jira_api, "FR", "Sprint 1")
+
+    assert issues == {
+        "FR-123": {
+            "key": "FR-123",
+            "type": "Story",
+            "epic": "Other",
+            "epic_status": "Other",
+            "summary": "Test issue",
+        }
+    }
+
+
+def test_find_issue_in_jira_sprint_with_epic(
+        mock_jira_api, search_effects, mock_epic):
+    mock_jira_api.search_issues = _fake_search(search_effects["epic"])
+    mock_jira_api.issue = Mock(return_value=mock_epic)
+
+    issues = find_issue_in_jira_sprint(mock_jira_api, "FR", "Sprint 1")
+
+    assert issues["FR-124"]["epic"] == "Epic A"
+    assert issues["FR-124"]["epic_status"] == "Done"
+
+
+def test_find_issue_in_jira_sprint_prints_goal(
+        mock_jira_api, search_effects, capsys):
+    mock_jira_api.search_issues = _fake_search(search_effects["basic"])
+
+    find_issue_in_jira_sprint(mock_jira_api, "FR", "Sprint 1")
+
+    captured = capsys.readouterr()
+    assert_ordered_substrings(captured.out,
+                              ("Pulse Goal:", "Ship the release"))
+
+
+def test_print_jira_issue(capsys):
+    sr_module.jira_server = "https://jira.example.com"
+
+    print_jira_issue({"key": "FR-123", "summary": "Test issue"})
+
+    captured = capsys.readouterr()
+    assert "FR-123" in captured.out
+    assert "Test issue" in captured.out
+
+
+def test_print_jira_issue_with_bug(capsys):
+    print_jira_issue(
+        {"key": "FR-125", "summary": "Fix the installer crash LP#2012345"})
+
+    captured = capsys.readouterr()
+    assert "[LP#2012345](https://pad.lv/2012345)" in captured.out
+
+
+def test_print_jira_report_empty(capfd):
+    print_jira_report({})
+
+    captured = capfd.readouterr()
+    assert captured.out == ""
+
+
+# In output order: the tasks section repeats the epic heading before
+# listing the task itself.
+EXPECTED_REPORT = ("Completed Epics:", "Completed Tasks:", "Epic A",
+                   "Task in an epic")
+
+
+def test_print_jira_report(capfd):
+    issues = {
+        "FR-124": {
+            "key": "FR-124",
+            "type": "Task",
+            "epic": "Epic A",
+            "epic_status": "Done",
+            "summary": "Task in an epic",
+        }
+    }
+
+    print_jira_report(issues)
+
+    captured = capfd.readouterr()
+    assert_ordered_substrings(captured.out, EXPECTED_REPORT)
+
+
+# (search_effects entry fed to search_issues, substrings expected in/out
+# of stdout; "present" lists are in output order)
+MAIN_CASES = [
+    ("basic",
+     {"present": ["Sprint 1", "Completed Epics:", "Completed Tasks:",
+                  "Test issue"],
+      "absent": []}),
+    ("empty",
+     {"present": ["Sprint 1"],
+      "absent": ["Completed Epics:", "Completed Tasks:"]}),
+    ("bug",
+     {"present": ["Sprint 1", "Completed Tasks:",
+                  "[LP#2012345](https://pad.lv/2012345)"],
+      "absent": []}),
+]
+
+# One compiled alternation per case with "absent" substrings: a single
+# regex pass instead of one full scan per substring.
+ABSENT_PATTERNS = {
+    effect: re.compile("|".join(map(re.escape, expected["absent"])))
+    for effect, expected in MAIN_CASES if expected["absent"]
+}
+
+
+@pytest.fixture(scope="module")
+def patched_jira():
+    # Every main() test wants the same JIRA/jira_api replacements, so
+    # patch once per module and undo once instead of per test; each test
+    # still assigns its own search_issues.
+    mp = pytest.MonkeyPatch()
+    mock_api_instance = Mock()
+    mock_api_instance.server = "https://jira.example.com"
+    mock_api_instance.login = "user@example.com"
+    mock_api_instance.token = "token"
+    mp.setattr("SprintReport.sprint_report.jira_api",
+               Mock(return_value=mock_api_instance))
+    mock_jira_instance = Mock()
+    mp.setattr("SprintReport.sprint_report.JIRA",
+               Mock(return_value=mock_jira_instance))
+    yield mock_jira_instance
+    mp.undo()
+
+
+def run_and_capture(argv, capfd):
+    main(argv)
+    return capfd.readouterr().out
+
+
+@pytest.mark.parametrize("effect,expected", MAIN_CASES)
+def test_main(patched_jira, search_effects, effect, expected, capfd):
+    patched_jira.search_issues = _fake_search(search_effects[effect])
+
+    out = run_and_capture(["FR", "Sprint 1"], capfd)
+
+    assert_ordered_substrings(out, expected["present"])
+    if effect in ABSENT_PATTERNS:
+        assert not ABSENT_PATTERNS[effect].search(out)